@@ -2,7 +2,7 @@
 import argparse
 import sys
 
-from audiblez.voices import voices, available_voices_str
+from audiblez.voices import voices, available_voices_str, VoiceError
 
 
 def cli_main():
@@ -38,8 +38,13 @@ def cli_main():
         else:
             print('CUDA GPU not available. Defaulting to CPU')
 
-    from core import main
-    main(args.epub_file_path, args.voice, args.pick, args.speed, args.output)
+    from audiblez.core import main
+    try:
+        main(args.epub_file_path, args.voice, args.pick, args.speed, args.output)
+    except VoiceError as e:
+        print(f'Voice validation error: {e}', file=sys.stderr)
+        print(f'\nAvailable voices:\n{available_voices_str}', file=sys.stderr)
+        sys.exit(1)
 
 
 if __name__ == '__main__':
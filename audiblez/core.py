@@ -27,7 +27,7 @@ from kokoro import KPipeline
 from ebooklib import epub
 from pick import pick
 # Import voice validation functions
-from audiblez.voices import validate_voice, is_voice_blend
+from audiblez.voices import check_voice, validate_voice, VoiceError
 
 # CHANGE: Add global nlp variable (set to None initially)
 nlp = None
@@ -86,6 +86,7 @@ def set_espeak_library():
 def main(file_path, voice, pick_manually, speed, output_folder='.',
          max_chapters=None, max_sentences=None, selected_chapters=None, post_event=None):
 
+    check_voice(voice)  # Fail fast on an invalid voice, raises VoiceError
     if post_event: post_event('CORE_STARTED')
     load_spacy()  #Existing call, now updated
     if output_folder != '.':
@@ -131,18 +132,12 @@ def main(file_path, voice, pick_manually, speed, output_folder='.',
     set_espeak_library()
 
     # Initialize pipeline and validate voice
-    lang_code = voice[0] if not is_voice_blend(voice) else voice.split(',')[0][0]  # Get lang from first voice in blend
+    lang_code = voice.partition(',')[0][0]  # Get lang from first voice in blend
     pipeline = KPipeline(lang_code=lang_code)
 
-    # Validate voice (handles both single and blended voices)
-    try:
-        validated_voice = validate_voice(voice, pipeline)
-        print(f"Using voice: {voice}")
-    except Exception as e:
-        print(f"Voice validation error: {e}")
-        from audiblez.voices import available_voices_str
-        print(f"\nAvailable voices:\n{available_voices_str}")
-        return  # Exit if voice is invalid
+    # Resolve voice (handles both single and blended voices)
+    validated_voice = validate_voice(voice, pipeline)
+    print(f"Using voice: {voice}")
 
     chapter_wav_files = []
     for i, chapter in enumerate(selected_chapters, start=1):
@@ -253,16 +248,17 @@ def gen_audio_segments(pipeline, text, validated_voice, speed, stats=None, max_s
 
 def gen_text(text, voice='af_heart', output_file='text.wav', speed=1, play=False):
     """Generate text with tensor-level voice blending support."""
-    lang_code = voice[0] if not is_voice_blend(voice) else voice.split(',')[0][0]
-    pipeline = KPipeline(lang_code=lang_code)
-
-    # Validate voice
+    # Validate voice before building the pipeline, which asserts on unknown language codes
     try:
-        validated_voice = validate_voice(voice, pipeline)
-    except Exception as e:
+        check_voice(voice)
+    except VoiceError as e:
         print(f"Voice validation error: {e}")
         return
 
+    lang_code = voice.partition(',')[0][0]
+    pipeline = KPipeline(lang_code=lang_code)
+    validated_voice = validate_voice(voice, pipeline)
+
     load_spacy()  # CHANGE: Ensure SpaCy is loaded here too
     audio_segments = gen_audio_segments(pipeline, text, validated_voice, speed)
     final_audio = np.concatenate(audio_segments)
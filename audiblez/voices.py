@@ -1,7 +1,15 @@
 # -*- coding: utf-8 -*-
+import functools
+import logging
+import math
 import platform
+import re
 import sys
-import torch
+
+log = logging.getLogger(__name__)
+
+class VoiceError(ValueError):
+    """Raised when a voice name or blend specification is invalid."""
 
 flags = {'a': '🇺🇸', 'b': '🇬🇧', 'e': '🇪🇸', 'f': '🇫🇷', 'h': '🇮🇳', 'i': '🇮🇹', 'j': '🇯🇵', 'p': '🇧🇷', 'z': '🇨🇳'}
 
@@ -23,25 +31,67 @@ voices = {
           'zm_yunyang']
 }
 
+_WEIGHT_RE = re.compile(r'[-+]?(?:\d+(?:\.\d*)?|\.\d+)')
+
+# Flat views of all voices, computed once at import time
+_ALL_VOICES_TUPLE = tuple(v for lang_voices in voices.values() for v in lang_voices)
+_ALL_VOICES = frozenset(_ALL_VOICES_TUPLE)
+_SUPPORTED_VOICES_STR = ', '.join(sorted(_ALL_VOICES))
+
 def get_all_voices():
     """Get a flat list of all available voices."""
-    all_voices = []
-    for lang_voices in voices.values():
-        all_voices.extend(lang_voices)
-    return all_voices
+    return list(_ALL_VOICES_TUPLE)
 
 def is_voice_blend(voice):
     """Check if a voice string represents a blend."""
-    return ',' in voice
+    return voice.find(',') != -1
+
+def _parse_voice_spec(voice):
+    """Parse a voice specification in a single pass.
 
-def try_tensor_blend(kokoro, voices_list, weights):
+    Returns:
+        tuple: ('single', voice) for a plain voice name, or
+               ('blend', [(voice, weight), ...]) for a blend specification
+
+    Raises:
+        VoiceError: If a blend weight is not a number
+    """
+    if voice.find(',') == -1:
+        return 'single', voice
+
+    pairs = []
+    for part in voice.split(','):
+        v, sep, w = part.partition(':')
+        if sep:
+            w = w.strip()
+            if not _WEIGHT_RE.fullmatch(w):
+                raise VoiceError(f"Invalid weight '{w}' - must be a number")
+            weight = float(w)
+        else:
+            weight = 50.0
+        pairs.append((sys.intern(v.strip()), weight))
+    return 'blend', pairs
+
+def try_tensor_blend(kokoro, voices_list, weights, device=None, dtype=None):
     """Attempt to create a tensor-level voice blend (fast method).
 
+    Args:
+        kokoro: Kokoro TTS instance used to load the voices
+        voices_list (list): The two voice names to blend
+        weights (list): Blend weights, normalized to sum to 100
+        device: Device to blend on and return the result on (default: device of the first voice)
+        dtype: dtype of the returned tensor (default: dtype of the first voice)
+
     Returns:
         torch.Tensor or None: Blended voice tensor if successful, None if not supported
     """
     try:
-        # Ensure voices are loaded into kokoro.voices
+        import torch
+    except ImportError:
+        return None  # Tensor blending not supported
+
+    try:
+        # Ensure voices are loaded into kokoro.voices, which caches them per pipeline
         kokoro.load_voice(voices_list[0])
         kokoro.load_voice(voices_list[1])
 
@@ -50,15 +100,66 @@ def try_tensor_blend(kokoro, voices_list, weights):
 
         if voice1_tensor is not None and voice2_tensor is not None:
             if torch.is_tensor(voice1_tensor) and torch.is_tensor(voice2_tensor):
-                # Blend the voice tensors
-                weight1, weight2 = weights[0] / 100, weights[1] / 100
-                blended = voice1_tensor * weight1 + voice2_tensor * weight2
-                return blended
+                # Weights are normalized to sum to 100, so the blend is a single lerp.
+                # Blend in float32 on the target device, then cast once to the output dtype
+                weight2 = weights[1] / 100
+                device = torch.device(device) if device is not None else voice1_tensor.device
+                dtype = dtype if dtype is not None else voice1_tensor.dtype
+                # Only host-to-device copies may be asynchronous: lerp could read an unfinished device-to-host copy
+                v1 = voice1_tensor.to(device=device, dtype=torch.float32,
+                                      non_blocking=voice1_tensor.device.type == 'cpu' and device.type != 'cpu')
+                v2 = voice2_tensor.to(device=device, dtype=torch.float32,
+                                      non_blocking=voice2_tensor.device.type == 'cpu' and device.type != 'cpu')
+                blended = torch.lerp(v1, v2, weight2)
+                return blended.to(dtype)
         return None  # Tensor blending not supported
     except Exception as e:
-        print(f"Tensor blending attempt failed: {e}")
+        log.warning("Tensor blending attempt failed: %s", e)
         return None
 
+def _normalize_weights(weights):
+    """Scale blend weights so they sum to 100."""
+    total = sum(weights)
+    if not math.isfinite(total):
+        raise VoiceError("Total weight must be a finite number")
+    if total == 0:
+        raise VoiceError("Total weight cannot be zero")
+    scale = 100.0 / total
+    return [w * scale for w in weights]
+
+@functools.lru_cache(maxsize=128)
+def _validate_single(voice):
+    """Validate a single (non-blended) voice name."""
+    if voice not in _ALL_VOICES:
+        raise VoiceError(f"Unsupported voice: '{voice}'\nSupported voices are: {_SUPPORTED_VOICES_STR}")
+    return voice
+
+def _check_blend(pairs):
+    """Validate parsed blend pairs and return (voices_list, normalized weights)."""
+    voices_list = [v for v, _ in pairs]
+
+    if len(voices_list) != 2:
+        raise VoiceError("Voice blending needs exactly two comma-separated voices")
+
+    # Validate voices exist
+    for v in voices_list:
+        if v not in _ALL_VOICES:
+            raise VoiceError(f"Unsupported voice: '{v}'\nSupported voices are: {_SUPPORTED_VOICES_STR}")
+
+    return voices_list, _normalize_weights([w for _, w in pairs])
+
+def check_voice(voice):
+    """Validate a voice name or blend specification without loading any voice.
+
+    Raises:
+        VoiceError: If the voice or blend specification is invalid
+    """
+    kind, pairs = _parse_voice_spec(voice)
+    if kind == 'blend':
+        _check_blend(pairs)
+    else:
+        _validate_single(sys.intern(voice))
+
 def validate_voice(voice, kokoro=None):
     """Validate voice and create tensor-level blend if possible.
 
@@ -71,67 +172,31 @@ def validate_voice(voice, kokoro=None):
 
     Returns:
         str or torch.Tensor: Voice name for single voice, or blended tensor for voice blend
+
+    Raises:
+        VoiceError: If the voice or blend specification is invalid
     """
-    try:
-        # Use the predefined voices list as the primary source (always non-empty)
-        supported_voices = set(get_all_voices())
-
-        # Parse comma separated voices for blend
-        if ',' in voice:
-            voices_list = []
-            weights = []
-
-            # Parse voice:weight pairs
-            for pair in voice.split(','):
-                if ':' in pair:
-                    v, w = pair.strip().split(':', 1)
-                    voices_list.append(v.strip())
-                    try:
-                        weights.append(float(w.strip()))
-                    except ValueError:
-                        raise ValueError(f"Invalid weight '{w.strip()}' - must be a number")
-                else:
-                    voices_list.append(pair.strip())
-                    weights.append(50.0)
-
-            if len(voices_list) != 2:
-                raise ValueError("Voice blending needs exactly two comma-separated voices")
-
-            # Validate voices exist
-            for v in voices_list:
-                if v not in supported_voices:
-                    supported_voices_list = ', '.join(sorted(supported_voices))
-                    raise ValueError(f"Unsupported voice: '{v}'\nSupported voices are: {supported_voices_list}")
-
-            # Normalize weights to sum to 100
-            total = sum(weights)
-            if total == 0:
-                raise ValueError("Total weight cannot be zero")
-            if total != 100:
-                weights = [w * (100/total) for w in weights]
-
-            # Try tensor-level blending
-            if kokoro:
-                blended_tensor = try_tensor_blend(kokoro, voices_list, weights)
-                if blended_tensor is not None:
-                    print(f"✅ Voice blend created: {voices_list[0]} ({weights[0]:.1f}%) + {voices_list[1]} ({weights[1]:.1f}%)")
-                    return blended_tensor
-
-            # If tensor blending failed, fall back to first voice
-            fallback_voice = voices_list[0]
-            print(f"❌ Tensor blending not supported - using fallback voice: {fallback_voice}")
-            print("   (Voice blending requires tensor-level access to voice embeddings)")
-            return fallback_voice
-
-        # Single voice validation
-        if voice not in supported_voices:
-            supported_voices_list = ', '.join(sorted(supported_voices))
-            raise ValueError(f"Unsupported voice: '{voice}'\nSupported voices are: {supported_voices_list}")
-
-        return voice
-    except Exception as e:
-        print(f"Error validating voice: {e}")
-        sys.exit(1)
+    # Parse comma separated voices for blend
+    kind, pairs = _parse_voice_spec(voice)
+    if kind == 'blend':
+        voices_list, weights = _check_blend(pairs)
+
+        # Try tensor-level blending
+        if kokoro:
+            blended_tensor = try_tensor_blend(kokoro, voices_list, weights)
+            if blended_tensor is not None:
+                log.debug("Voice blend created: %s (%.1f%%) + %s (%.1f%%)",
+                          voices_list[0], weights[0], voices_list[1], weights[1])
+                return blended_tensor
+
+        # If tensor blending failed, fall back to first voice
+        fallback_voice = voices_list[0]
+        log.warning("Tensor blending not supported - using fallback voice: %s "
+                    "(voice blending requires tensor-level access to voice embeddings)", fallback_voice)
+        return fallback_voice
+
+    # Single voice validation
+    return _validate_single(sys.intern(voice))
 
 
 def parse_voice_blend(voice):
@@ -143,41 +208,16 @@ def parse_voice_blend(voice):
     Returns:
         tuple: (voice1, weight1, voice2, weight2) or None if not a blend
     """
-    if not is_voice_blend(voice):
-        return None
-
     try:
-        parts = voice.split(',')
-        if len(parts) != 2:
-            return None
-
-        voice1_part = parts[0].strip()
-        voice2_part = parts[1].strip()
-
-        if ':' in voice1_part:
-            voice1, weight1_str = voice1_part.split(':', 1)
-            weight1 = float(weight1_str.strip())
-        else:
-            voice1 = voice1_part
-            weight1 = 50.0
-
-        if ':' in voice2_part:
-            voice2, weight2_str = voice2_part.split(':', 1)
-            weight2 = float(weight2_str.strip())
-        else:
-            voice2 = voice2_part
-            weight2 = 50.0
-
-        return (voice1.strip(), weight1, voice2.strip(), weight2)
+        kind, pairs = _parse_voice_spec(voice)
+    except ValueError:
+        return None
 
-    except Exception:
+    if kind != 'blend' or len(pairs) != 2:
         return None
 
-# Generate the available voices display string
-if platform.system() == 'Windows':
-    available_voices_str = '\n'.join([f'  {flags_win[lang]}:\t{", ".join(voices[lang])}' for lang in voices])
-else:
-    available_voices_str = '\n'.join([f'  {flags[lang]}:\t{", ".join(voices[lang])}' for lang in voices])
+    (voice1, weight1), (voice2, weight2) = pairs
+    return (voice1, weight1, voice2, weight2)
 
 # Add blending information to the help string
 blending_help = """
@@ -187,4 +227,8 @@ Voice Blending (Tensor-level only - same speed as single voice):
   Note: Falls back to first voice if tensor blending unavailable
 """
 
-available_voices_str += "\n" + blending_help
+# Generate the available voices display string
+_flag_map = flags_win if platform.system() == 'Windows' else flags
+available_voices_str = '\n'.join(
+    f'  {_flag_map[lang]}:\t{", ".join(lang_voices)}' for lang, lang_voices in voices.items()
+) + '\n' + blending_help
@@ -1,4 +1,5 @@
 import os
+import subprocess
 import unittest
 from pathlib import Path
 from tempfile import NamedTemporaryFile
@@ -28,6 +29,12 @@ class CliTest(unittest.TestCase):
         self.assertTrue(Path('./prova/mini.m4b').exists())
         self.assertTrue(Path('./prova/mini.m4b').stat().st_size > 256 * 1024)
 
+    def test_invalid_voice_exits_with_error(self):
+        cmd = 'cd .. && python -m audiblez.cli epub/mini.epub -v xx_nobody'
+        result = subprocess.run(cmd, shell=True, capture_output=True, text=True)
+        self.assertEqual(result.returncode, 1)
+        self.assertIn('Unsupported voice', result.stderr)
+
     @unittest.skip('Not implemented yet')
     def test_md(self):
         content = (
@@ -0,0 +1,90 @@
+import unittest
+
+try:
+    import torch
+except ImportError:
+    torch = None
+
+from audiblez import voices
+from audiblez.voices import check_voice, validate_voice, parse_voice_blend, VoiceError, _normalize_weights
+
+
+class FakeKokoro:
+    def __init__(self, tensors):
+        self.tensors = tensors
+        self.voices = {}
+        self.loaded = []
+
+    def load_voice(self, name):
+        self.loaded.append(name)
+        if name in self.tensors:
+            self.voices[name] = self.tensors[name]
+
+
+class VoicesTest(unittest.TestCase):
+    def test_single_voice(self):
+        self.assertEqual(validate_voice('af_sky'), 'af_sky')
+
+    def test_unsupported_voice_raises(self):
+        with self.assertRaises(VoiceError):
+            validate_voice('xx_nobody')
+
+    def test_invalid_blend_raises(self):
+        with self.assertRaises(VoiceError):
+            validate_voice('af_sarah:abc,am_adam:40')
+        with self.assertRaises(VoiceError):
+            validate_voice('af_sarah,am_adam,af_sky')
+        with self.assertRaises(VoiceError):
+            validate_voice('af_sarah:0,am_adam:0')
+
+    def test_blend_without_kokoro_falls_back_to_first_voice(self):
+        self.assertEqual(validate_voice('af_sarah:60,am_adam:40'), 'af_sarah')
+
+    def test_check_voice(self):
+        check_voice('af_sky')
+        check_voice('af_sarah:60,am_adam:40')
+        for voice in ['xx_nobody', 'af_sarah:60,xx_nobody:40', 'af_sarah:abc,am_adam', 'af_sarah:0,am_adam:0']:
+            with self.assertRaises(VoiceError, msg=voice):
+                check_voice(voice)
+
+    def test_parse_voice_blend(self):
+        self.assertEqual(parse_voice_blend('af_sarah:60, am_adam:40'), ('af_sarah', 60.0, 'am_adam', 40.0))
+        self.assertEqual(parse_voice_blend('af_sarah,am_adam'), ('af_sarah', 50.0, 'am_adam', 50.0))
+        self.assertIsNone(parse_voice_blend('af_sky'))
+        self.assertIsNone(parse_voice_blend('af_sarah:abc,am_adam'))
+
+    def test_normalize_weights(self):
+        self.assertEqual(_normalize_weights([60.0, 40.0]), [60.0, 40.0])
+        self.assertAlmostEqual(_normalize_weights([70.0, 20.0])[0], 700 / 9, places=12)
+        with self.assertRaises(VoiceError):
+            _normalize_weights([0.0, 0.0])
+
+    def test_non_finite_total_weight_raises(self):
+        with self.assertRaises(VoiceError):
+            validate_voice('af_sarah:' + '1' * 400 + ',am_adam:1')
+
+    @unittest.skipUnless(torch, 'torch not installed')
+    def test_tensor_blend_on_target_device(self):
+        kokoro = FakeKokoro({'af_sarah': torch.ones(3), 'am_adam': torch.zeros(3)})
+        blended = voices.try_tensor_blend(kokoro, ['af_sarah', 'am_adam'], [60.0, 40.0], device='cpu')
+        self.assertEqual(blended.device.type, 'cpu')
+        self.assertTrue(torch.allclose(blended, torch.full((3,), 0.6)))
+
+    @unittest.skipUnless(torch, 'torch not installed')
+    def test_tensor_blend_keeps_voice_dtype(self):
+        for dtype in (torch.float64, torch.float16):
+            v1 = torch.linspace(-1, 1, 8, dtype=dtype)
+            v2 = torch.linspace(2, 0, 8, dtype=dtype)
+            kokoro = FakeKokoro({'af_sarah': v1, 'am_adam': v2})
+            blended = voices.try_tensor_blend(kokoro, ['af_sarah', 'am_adam'], [70.0, 30.0])
+            self.assertEqual(blended.dtype, dtype)
+            expected = v1.double() * 0.7 + v2.double() * 0.3
+            self.assertTrue(torch.allclose(blended.double(), expected, atol=1e-3))
+
+    def test_weight_format(self):
+        for weight, expected in [('60', 60.0), ('+5', 5.0), ('-2', -2.0), ('.5', 0.5), ('5.', 5.0), (' 30 ', 30.0)]:
+            self.assertEqual(parse_voice_blend(f'af_sarah:{weight},am_adam:40')[1], expected, weight)
+        for weight in ['1e2', '1_0', 'nan', 'inf', '', 'abc', '--1', '1.2.3']:
+            self.assertIsNone(parse_voice_blend(f'af_sarah:{weight},am_adam:40'), weight)
+            with self.assertRaises(VoiceError, msg=weight):
+                validate_voice(f'af_sarah:{weight},am_adam:40')